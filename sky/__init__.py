@@ -1,7 +1,11 @@
 """The SkyPilot package."""
+import importlib
+import importlib.util
 import os
 import subprocess
-from typing import Optional
+import sys
+import typing
+from typing import Any, Dict, List, Optional, Tuple
 import urllib.request
 
 # Replaced with the current commit when building the wheels.
@@ -77,59 +81,179 @@ def _set_http_proxy_env_vars() -> None:
 _set_http_proxy_env_vars()
 # ----------------------------------------------------------------- #
 
-# Keep this order to avoid cyclic imports
-# pylint: disable=wrong-import-position
-from sky import backends
-from sky import benchmark
-from sky import clouds
-from sky.clouds.service_catalog import list_accelerators
-from sky.core import autostop
-from sky.core import cancel
-from sky.core import cost_report
-from sky.core import down
-from sky.core import download_logs
-from sky.core import job_status
-from sky.core import queue
-from sky.core import start
-from sky.core import status
-from sky.core import stop
-from sky.core import storage_delete
-from sky.core import storage_ls
-from sky.core import tail_logs
-from sky.dag import Dag
-from sky.data import Storage
-from sky.data import StorageMode
-from sky.data import StoreType
-from sky.execution import exec  # pylint: disable=redefined-builtin
-from sky.execution import launch
-from sky.optimizer import Optimizer
-from sky.optimizer import OptimizeTarget
-from sky.resources import Resources
-from sky.skylet.job_lib import JobStatus
-# TODO (zhwu): These imports are for backward compatibility, and spot APIs
-# should be called with `sky.spot.xxx` instead. Remove in release 0.7.0
-from sky.spot.core import spot_cancel
-from sky.spot.core import spot_launch
-from sky.spot.core import spot_queue
-from sky.spot.core import spot_tail_logs
-from sky.status_lib import ClusterStatus
-from sky.task import Task
-
-# Aliases.
-IBM = clouds.IBM
-AWS = clouds.AWS
-Azure = clouds.Azure
-Cudo = clouds.Cudo
-GCP = clouds.GCP
-Lambda = clouds.Lambda
-SCP = clouds.SCP
-Kubernetes = clouds.Kubernetes
-OCI = clouds.OCI
-Paperspace = clouds.Paperspace
-RunPod = clouds.RunPod
-Vsphere = clouds.Vsphere
-Fluidstack = clouds.Fluidstack
-optimize = Optimizer.optimize
+# The public API below is resolved lazily on first attribute access (PEP 562),
+# so that `import sky` (e.g., by the codegen run on the head node for every
+# `sky queue`) does not pull in the clouds, backends and their SDKs.
+# Maps public name -> (module, attribute path). An attribute path of None means
+# the name is the module itself.
+_LAZY_ATTRS: Dict[str, Tuple[str, Optional[str]]] = {
+    'backends': ('sky.backends', None),
+    'benchmark': ('sky.benchmark', None),
+    'clouds': ('sky.clouds', None),
+    'list_accelerators': ('sky.clouds.service_catalog', 'list_accelerators'),
+    'autostop': ('sky.core', 'autostop'),
+    'cancel': ('sky.core', 'cancel'),
+    'cost_report': ('sky.core', 'cost_report'),
+    'down': ('sky.core', 'down'),
+    'download_logs': ('sky.core', 'download_logs'),
+    'job_status': ('sky.core', 'job_status'),
+    'queue': ('sky.core', 'queue'),
+    'start': ('sky.core', 'start'),
+    'status': ('sky.core', 'status'),
+    'stop': ('sky.core', 'stop'),
+    'storage_delete': ('sky.core', 'storage_delete'),
+    'storage_ls': ('sky.core', 'storage_ls'),
+    'tail_logs': ('sky.core', 'tail_logs'),
+    'Dag': ('sky.dag', 'Dag'),
+    'Storage': ('sky.data', 'Storage'),
+    'StorageMode': ('sky.data', 'StorageMode'),
+    'StoreType': ('sky.data', 'StoreType'),
+    'exec': ('sky.execution', 'exec'),
+    'launch': ('sky.execution', 'launch'),
+    'Optimizer': ('sky.optimizer', 'Optimizer'),
+    'OptimizeTarget': ('sky.optimizer', 'OptimizeTarget'),
+    'optimize': ('sky.optimizer', 'Optimizer.optimize'),
+    'Resources': ('sky.resources', 'Resources'),
+    'JobStatus': ('sky.skylet.job_lib', 'JobStatus'),
+    # TODO (zhwu): These imports are for backward compatibility, and spot APIs
+    # should be called with `sky.spot.xxx` instead. Remove in release 0.7.0
+    'spot_cancel': ('sky.spot.core', 'spot_cancel'),
+    'spot_launch': ('sky.spot.core', 'spot_launch'),
+    'spot_queue': ('sky.spot.core', 'spot_queue'),
+    'spot_tail_logs': ('sky.spot.core', 'spot_tail_logs'),
+    'ClusterStatus': ('sky.status_lib', 'ClusterStatus'),
+    'Task': ('sky.task', 'Task'),
+    # Aliases.
+    'IBM': ('sky.clouds', 'IBM'),
+    'AWS': ('sky.clouds', 'AWS'),
+    'Azure': ('sky.clouds', 'Azure'),
+    'Cudo': ('sky.clouds', 'Cudo'),
+    'GCP': ('sky.clouds', 'GCP'),
+    'Lambda': ('sky.clouds', 'Lambda'),
+    'SCP': ('sky.clouds', 'SCP'),
+    'Kubernetes': ('sky.clouds', 'Kubernetes'),
+    'OCI': ('sky.clouds', 'OCI'),
+    'Paperspace': ('sky.clouds', 'Paperspace'),
+    'RunPod': ('sky.clouds', 'RunPod'),
+    'Vsphere': ('sky.clouds', 'Vsphere'),
+    'Fluidstack': ('sky.clouds', 'Fluidstack'),
+}
+
+# Modules that can be imported on their own. Everything else is part of the
+# import cycle rooted at `sky.backends` (backends -> optimizer -> resources ->
+# spot -> backends, ...), so `sky.backends` has to be imported first to avoid
+# cyclic imports.
+_STANDALONE_MODULES = frozenset([
+    'sky.benchmark',
+    'sky.clouds',
+    'sky.clouds.service_catalog',
+    'sky.dag',
+    'sky.skylet.job_lib',
+    'sky.status_lib',
+])
+
+# Submodules in the import cycle above, which may be imported with
+# `from sky import <submodule>` before `sky.backends` is loaded.
+_CYCLIC_SUBMODULES = frozenset([
+    'core',
+    'data',
+    'execution',
+    'optimizer',
+    'resources',
+    'serve',
+    'spot',
+    'task',
+])
+
+if typing.TYPE_CHECKING:
+    # pylint: disable=ungrouped-imports
+    from sky import backends
+    from sky import benchmark
+    from sky import clouds
+    from sky.clouds import AWS
+    from sky.clouds import Azure
+    from sky.clouds import Cudo
+    from sky.clouds import Fluidstack
+    from sky.clouds import GCP
+    from sky.clouds import IBM
+    from sky.clouds import Kubernetes
+    from sky.clouds import Lambda
+    from sky.clouds import OCI
+    from sky.clouds import Paperspace
+    from sky.clouds import RunPod
+    from sky.clouds import SCP
+    from sky.clouds import Vsphere
+    from sky.clouds.service_catalog import list_accelerators
+    from sky.core import autostop
+    from sky.core import cancel
+    from sky.core import cost_report
+    from sky.core import down
+    from sky.core import download_logs
+    from sky.core import job_status
+    from sky.core import queue
+    from sky.core import start
+    from sky.core import status
+    from sky.core import stop
+    from sky.core import storage_delete
+    from sky.core import storage_ls
+    from sky.core import tail_logs
+    from sky.dag import Dag
+    from sky.data import Storage
+    from sky.data import StorageMode
+    from sky.data import StoreType
+    from sky.execution import exec  # pylint: disable=redefined-builtin
+    from sky.execution import launch
+    from sky.optimizer import Optimizer
+    from sky.optimizer import OptimizeTarget
+    from sky.resources import Resources
+    from sky.skylet.job_lib import JobStatus
+    from sky.spot.core import spot_cancel
+    from sky.spot.core import spot_launch
+    from sky.spot.core import spot_queue
+    from sky.spot.core import spot_tail_logs
+    from sky.status_lib import ClusterStatus
+    from sky.task import Task
+    optimize = Optimizer.optimize
+
+
+def __getattr__(name: str) -> Any:
+    """Imports the public API lazily on first access (PEP 562)."""
+    if name in _CYCLIC_SUBMODULES:
+        # Let `from sky import <submodule>` import the submodule after
+        # `sky.backends`, which imports the submodule as a side effect.
+        importlib.import_module('sky.backends')
+        if name in globals():
+            return globals()[name]
+    if name not in _LAZY_ATTRS:
+        # Other submodules, e.g. `sky.global_user_state`, used to be imported
+        # as a side effect of `import sky`, so keep them accessible as
+        # attributes. Only the submodule itself is imported: this is also
+        # reached by `from sky import <submodule>` inside the package, where
+        # importing `sky.backends` would re-enter the import cycle.
+        module_name = f'{__name__}.{name}'
+        module = sys.modules.get(module_name)
+        if module is None:
+            if importlib.util.find_spec(module_name) is None:
+                raise AttributeError(
+                    f'module {__name__!r} has no attribute {name!r}')
+            module = importlib.import_module(module_name)
+        return module
+    module_name, attr_path = _LAZY_ATTRS[name]
+    if module_name not in _STANDALONE_MODULES:
+        importlib.import_module('sky.backends')
+    value = importlib.import_module(module_name)
+    if attr_path is not None:
+        for attr in attr_path.split('.'):
+            value = getattr(value, attr)
+    # Cache the value in the module namespace, so that later accesses do not
+    # go through __getattr__ again.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     '__version__',
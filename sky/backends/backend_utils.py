@@ -11,6 +11,7 @@ import subprocess
 import sys
 import tempfile
 import textwrap
+import threading
 import time
 import typing
 from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
@@ -99,6 +100,41 @@ DEFAULT_TASK_CPU_DEMAND = 0.5
 # Filelocks for the cluster status change.
 CLUSTER_STATUS_LOCK_PATH = os.path.expanduser('~/.sky/.{}.lock')
 CLUSTER_STATUS_LOCK_TIMEOUT_SECONDS = 20
+# Max number of clusters refreshed concurrently in get_clusters(). Refreshing
+# is bound by the cloud API round trips rather than local CPU, so we do not
+# limit it to the number of CPUs.
+_MAX_CLUSTER_STATUS_REFRESH_THREADS = 32
+
+# How long the status from refresh_cluster_status_handle() is reused for the
+# same cluster in this process, to avoid querying the cloud again when several
+# operations on the cluster are issued in a row. Set the env var to 0 to
+# disable.
+_CLUSTER_STATUS_CACHE_TTL_ENV_VAR = 'SKYPILOT_STATUS_CACHE_TTL_SECONDS'
+_DEFAULT_CLUSTER_STATUS_CACHE_TTL_SECONDS = 5.0
+
+
+def _get_cluster_status_cache_ttl_seconds() -> float:
+    value = os.environ.get(_CLUSTER_STATUS_CACHE_TTL_ENV_VAR)
+    if value is None:
+        return _DEFAULT_CLUSTER_STATUS_CACHE_TTL_SECONDS
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f'Invalid {_CLUSTER_STATUS_CACHE_TTL_ENV_VAR}={value!r}'
+                       ', expected a number of seconds. Using the default '
+                       f'{_DEFAULT_CLUSTER_STATUS_CACHE_TTL_SECONDS} seconds.')
+        return _DEFAULT_CLUSTER_STATUS_CACHE_TTL_SECONDS
+
+
+_CLUSTER_STATUS_CACHE_TTL_SECONDS = _get_cluster_status_cache_ttl_seconds()
+# The clock of the cache, patched by the tests.
+_monotonic = time.monotonic
+# Cluster name -> (_monotonic() of the refresh, refreshed status, the
+# launched_at of the refreshed record).
+_cluster_status_cache: Dict[str, Tuple[float,
+                                       Optional[status_lib.ClusterStatus],
+                                       Optional[int]]] = {}
+_cluster_status_cache_lock = threading.Lock()
 
 # Filelocks for updating cluster's file_mounts.
 CLUSTER_FILE_MOUNTS_LOCK_PATH = os.path.expanduser(
@@ -108,6 +144,11 @@ CLUSTER_FILE_MOUNTS_LOCK_TIMEOUT_SECONDS = 10
 # Remote dir that holds our runtime files.
 _REMOTE_RUNTIME_FILES_DIR = '~/.sky/.runtime_files'
 
+# Separates the outputs of the commands batched by make_batched_command(). It is
+# the ASCII record separator, which does not appear in the payloads of the
+# codegens, as json.dumps() escapes control characters.
+_BATCHED_OUTPUT_SEPARATOR = '\x1e'
+
 # Include the fields that will be used for generating tags that distinguishes
 # the cluster in ray, to avoid the stopped cluster being discarded due to
 # updates in the yaml template.
@@ -1280,6 +1321,51 @@ def parallel_data_transfer_to_nodes(
         subprocess_utils.run_in_parallel(_sync_node, runners)
 
 
+def make_batched_command(cmds: List[str]) -> str:
+    """Returns a command that runs `cmds` sequentially in a single shell.
+
+    Running the batched command on a remote node takes one SSH round trip for
+    all the commands. Each command runs in its own subshell, so that a failed
+    command (or one calling `exit`) does not affect the others. The output of
+    the batched command should be parsed with parse_batched_outputs().
+    """
+    sep = f'\\{ord(_BATCHED_OUTPUT_SEPARATOR):03o}'
+    script = ['_sky_batch_stderr=$(mktemp)']
+    for cmd in cmds:
+        script.append(f'({cmd}) 2>"$_sky_batch_stderr" </dev/null; '
+                      f'printf \'{sep}%s{sep}\' "$?"; '
+                      f'cat "$_sky_batch_stderr"; printf \'{sep}\'')
+    script.append('rm -f "$_sky_batch_stderr"')
+    return '\n'.join(script)
+
+
+def parse_batched_outputs(stdout: str,
+                          num_cmds: int) -> List[Tuple[int, str, str]]:
+    """Parses the output of a command from make_batched_command().
+
+    Returns:
+        A list of (returncode, stdout, stderr), one for each batched command.
+
+    Raises:
+        ValueError: if the output is not from a batch of `num_cmds` commands.
+    """
+    fields = stdout.split(_BATCHED_OUTPUT_SEPARATOR)
+    # Each command outputs 3 fields (stdout, returncode, stderr), and the
+    # output ends with a separator.
+    if len(fields) != 3 * num_cmds + 1 or fields[-1].strip():
+        raise ValueError(
+            f'Invalid output of {num_cmds} batched commands: \n{stdout}')
+    results = []
+    for i in range(num_cmds):
+        cmd_stdout, returncode, cmd_stderr = fields[3 * i:3 * i + 3]
+        results.append((int(returncode), cmd_stdout, cmd_stderr))
+    return results
+
+
+# The local GPUs do not change during the lifetime of the process, and this is
+# called every time a LocalDockerBackend is constructed (e.g., by
+# get_backend_from_handle()), so cache the result to avoid the subprocesses.
+@functools.lru_cache(maxsize=1)
 def check_local_gpus() -> bool:
     """Checks if GPUs are available locally.
 
@@ -2080,17 +2166,60 @@ def refresh_cluster_status_handle(
     This is a wrapper of refresh_cluster_record, which returns the status and
     handle of the cluster.
     Please refer to the docstring of refresh_cluster_record for the details.
+
+    Unless force_refresh_statuses is specified, the status refreshed within
+    the last _CLUSTER_STATUS_CACHE_TTL_SECONDS is reused, as long as the
+    cluster record has not changed since. Use clear_cluster_status_cache() to
+    drop the reused statuses.
     """
+    if force_refresh_statuses is None and _CLUSTER_STATUS_CACHE_TTL_SECONDS > 0:
+        with _cluster_status_cache_lock:
+            cached = _cluster_status_cache.get(cluster_name)
+        if cached is not None and (_monotonic() - cached[0] <
+                                   _CLUSTER_STATUS_CACHE_TTL_SECONDS):
+            _, cached_status, cached_launched_at = cached
+            # Reading the record is cheap, and makes sure the status has not
+            # been changed, e.g. by a stop or down, since it was refreshed.
+            record = global_user_state.get_cluster_from_name(cluster_name)
+            if record is None:
+                if cached_status is None:
+                    return None, None
+            elif (record['status'] == cached_status and
+                  record['launched_at'] == cached_launched_at):
+                return record['status'], record['handle']
+
+    refreshed_at = _monotonic()
     record = refresh_cluster_record(
         cluster_name,
         force_refresh_statuses=force_refresh_statuses,
         acquire_per_cluster_status_lock=acquire_per_cluster_status_lock,
         cluster_status_lock_timeout=cluster_status_lock_timeout)
+    with _cluster_status_cache_lock:
+        if record is None:
+            _cluster_status_cache[cluster_name] = (refreshed_at, None, None)
+        else:
+            _cluster_status_cache[cluster_name] = (refreshed_at,
+                                                   record['status'],
+                                                   record['launched_at'])
     if record is None:
         return None, None
     return record['status'], record['handle']
 
 
+def clear_cluster_status_cache(cluster_name: Optional[str] = None) -> None:
+    """Drops the statuses reused by refresh_cluster_status_handle().
+
+    Args:
+        cluster_name: The cluster to drop the status of. If None, drop the
+            statuses of all clusters.
+    """
+    with _cluster_status_cache_lock:
+        if cluster_name is None:
+            _cluster_status_cache.clear()
+        else:
+            _cluster_status_cache.pop(cluster_name, None)
+
+
 # =====================================
 
 
@@ -2232,7 +2361,7 @@ def check_cluster_available(
 
 # TODO(tian): Refactor to controller_utils. Current blocker: circular import.
 def is_controller_accessible(
-    controller_type: controller_utils.Controllers,
+    controller_type: 'controller_utils.Controllers',
     stopped_message: str,
     non_existent_message: Optional[str] = None,
     exit_if_not_accessible: bool = False,
@@ -2408,13 +2537,13 @@ def get_clusters(
     if cluster_names is not None:
         if isinstance(cluster_names, str):
             cluster_names = [cluster_names]
+        records_by_name = {record['name']: record for record in records}
         new_records = []
         not_exist_cluster_names = []
         for cluster_name in cluster_names:
-            for record in records:
-                if record['name'] == cluster_name:
-                    new_records.append(record)
-                    break
+            record = records_by_name.get(cluster_name)
+            if record is not None:
+                new_records.append(record)
             else:
                 not_exist_cluster_names.append(cluster_name)
         if not_exist_cluster_names:
@@ -2452,7 +2581,9 @@ def get_clusters(
     cluster_names = [record['name'] for record in records]
     with progress:
         updated_records = subprocess_utils.run_in_parallel(
-            _refresh_cluster, cluster_names)
+            _refresh_cluster,
+            cluster_names,
+            num_threads=_MAX_CLUSTER_STATUS_REFRESH_THREADS)
 
     # Show information for removed clusters.
     kept_records = []
@@ -3579,7 +3579,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         )
 
     def tail_serve_logs(self, handle: CloudVmRayResourceHandle,
-                        service_name: str, target: serve_lib.ServiceComponent,
+                        service_name: str, target: 'serve_lib.ServiceComponent',
                         replica_id: Optional[int], follow: bool) -> None:
         """Tail the logs of a service.
 
@@ -4114,6 +4114,43 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             **kwargs,
         )
 
+    def run_on_head_batch(
+        self,
+        handle: CloudVmRayResourceHandle,
+        cmds: List[str],
+    ) -> List[Tuple[int, str, str]]:
+        """Runs multiple commands on the cluster's head node in one round trip.
+
+        The commands run sequentially over a single SSH connection, instead
+        of one connection per run_on_head() call.
+
+        Args:
+            handle: The ResourceHandle to the cluster.
+            cmds: The commands to run.
+
+        Returns:
+            A list of (returncode, stdout, stderr), one for each command in
+            `cmds`. If the SSH connection fails, every command gets the
+            returncode and stderr of the connection.
+
+        Raises:
+            exceptions.FetchIPError: If the head node IP cannot be fetched.
+        """
+        if not cmds:
+            return []
+        returncode, stdout, stderr = self.run_on_head(
+            handle,
+            backend_utils.make_batched_command(cmds),
+            require_outputs=True,
+            separate_stderr=True,
+            stream_logs=False)
+        try:
+            return backend_utils.parse_batched_outputs(stdout, len(cmds))
+        except ValueError:
+            if returncode == 0:
+                raise
+            return [(returncode, '', stdout + stderr)] * len(cmds)
+
     # --- Utilities ---
 
     @timeline.event
@@ -4,10 +4,11 @@ import functools
 import json
 import os
 import re
+import shlex
 import subprocess
 import textwrap
 import typing
-from typing import Dict, Iterator, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import colorama
 
@@ -41,13 +42,16 @@ _DEFAULT_AZURE_UBUNTU_HPC_IMAGE_GB = 30
 _DEFAULT_AZURE_UBUNTU_2004_IMAGE_GB = 150
 
 
-def _run_output(cmd):
+def _run_output(cmd: Union[str, List[str]]) -> str:
+    # Run without a shell to save spawning /bin/sh for each call.
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
     proc = subprocess.run(cmd,
-                          shell=True,
                           check=True,
+                          stdin=subprocess.DEVNULL,
                           stderr=subprocess.PIPE,
                           stdout=subprocess.PIPE)
-    return proc.stdout.decode('ascii')
+    return proc.stdout.decode('utf-8', errors='replace')
 
 
 @clouds.CLOUD_REGISTRY.register
@@ -459,7 +463,7 @@ class Azure(clouds.Cloud):
 
         try:
             _run_output('az --version')
-        except subprocess.CalledProcessError as e:
+        except (FileNotFoundError, subprocess.CalledProcessError) as e:
             return False, (
                 # TODO(zhwu): Change the installation hint to from PyPI.
                 'Azure CLI `az --version` errored. Run the following commands:'
@@ -1,8 +1,9 @@
 """Cudo Compute"""
 import json
+import shlex
 import subprocess
 import typing
-from typing import Dict, Iterator, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from sky import clouds
 from sky.clouds import service_catalog
@@ -19,13 +20,16 @@ _CREDENTIAL_FILES = [
 ]
 
 
-def _run_output(cmd):
+def _run_output(cmd: Union[str, List[str]]) -> str:
+    # Run without a shell to save spawning /bin/sh for each call.
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
     proc = subprocess.run(cmd,
-                          shell=True,
                           check=True,
+                          stdin=subprocess.DEVNULL,
                           stderr=subprocess.PIPE,
                           stdout=subprocess.PIPE)
-    return proc.stdout.decode('ascii')
+    return proc.stdout.decode('utf-8', errors='replace')
 
 
 @clouds.CLOUD_REGISTRY.register
@@ -268,7 +272,8 @@ class Cudo(clouds.Cloud):
 
         try:
             _run_output('cudoctl --version')
-        except (ImportError, subprocess.CalledProcessError) as e:
+        except (ImportError, FileNotFoundError,
+                subprocess.CalledProcessError) as e:
             return False, (
                 f'{cls._CREDENTIAL_HINT}\n'
                 f'{cls._INDENT_PREFIX}'
@@ -4,10 +4,11 @@ import functools
 import json
 import os
 import re
+import shlex
 import subprocess
 import time
 import typing
-from typing import Dict, Iterator, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import colorama
 
@@ -94,13 +95,16 @@ _IMAGE_NOT_FOUND_UX_MESSAGE = (
 )
 
 
-def _run_output(cmd):
+def _run_output(cmd: Union[str, List[str]]) -> str:
+    # Run without a shell to save spawning /bin/sh for each call.
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
     proc = subprocess.run(cmd,
-                          shell=True,
                           check=True,
+                          stdin=subprocess.DEVNULL,
                           stderr=subprocess.PIPE,
                           stdout=subprocess.PIPE)
-    return proc.stdout.decode('ascii')
+    return proc.stdout.decode('utf-8', errors='replace')
 
 
 def is_api_disabled(endpoint: str, project_id: str) -> bool:
@@ -635,7 +639,8 @@ class GCP(clouds.Cloud):
 
             # Check the installation of google-cloud-sdk.
             _run_output('gcloud --version')
-        except (ImportError, subprocess.CalledProcessError) as e:
+        except (ImportError, FileNotFoundError,
+                subprocess.CalledProcessError) as e:
             return False, (
                 f'{cls._DEPENDENCY_HINT}\n'
                 f'{cls._INDENT_PREFIX}Credentials may also need to be set. '
@@ -804,7 +809,7 @@ class GCP(clouds.Cloud):
             account = _run_output('gcloud auth list --filter=status:ACTIVE '
                                   '--format="value(account)"')
             account = account.strip()
-        except subprocess.CalledProcessError as e:
+        except (FileNotFoundError, subprocess.CalledProcessError) as e:
             with ux_utils.print_exception_no_traceback():
                 raise exceptions.CloudUserIdentityError(
                     f'Failed to get GCP user identity with unknown '
@@ -282,7 +282,11 @@ class Kubernetes(clouds.Cloud):
         fuzzy_candidate_list: List[str] = []
         if resources.instance_type is not None:
             assert resources.is_launchable(), resources
-            resources = resources.copy(accelerators=None)
+            # The accelerators are None only if they are neither specified
+            # nor inferred from the instance type, in which case the copy
+            # would be identical.
+            if resources.accelerators is not None:
+                resources = resources.copy(accelerators=None)
             return ([resources], fuzzy_candidate_list)
 
         def _make(instance_list):
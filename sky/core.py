@@ -1,7 +1,8 @@
 """SDK functions for cluster/job management."""
+import functools
 import getpass
 import typing
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import colorama
 
@@ -33,6 +34,30 @@ logger = sky_logging.init_logger(__name__)
 # pylint: disable=redefined-builtin
 
 
+@functools.lru_cache(maxsize=1)
+def _current_user() -> str:
+    # getpass.getuser() may look up the password database (e.g., through NSS
+    # or LDAP), and the user does not change during the process.
+    return getpass.getuser()
+
+
+def _check_cluster_available_and_get_backend(
+    cluster_name: str, operation: str
+) -> Tuple['backends.CloudVmRayResourceHandle', 'backends.CloudVmRayBackend']:
+    """Checks the cluster is available, and returns its handle and backend.
+
+    The cluster status is refreshed (at most) once, by
+    backend_utils.check_cluster_available(). Please refer to its docstring for
+    the exceptions raised.
+    """
+    handle = backend_utils.check_cluster_available(
+        cluster_name,
+        operation=operation,
+    )
+    backend = backend_utils.get_backend_from_handle(handle)
+    return handle, backend
+
+
 @usage_lib.entrypoint
 def status(cluster_names: Optional[Union[str, List[str]]] = None,
            refresh: bool = False) -> List[Dict[str, Any]]:
@@ -442,15 +467,8 @@ def autostop(
         raise exceptions.NotSupportedError(
             f'{operation} SkyPilot controller {cluster_name!r} '
             f'is not supported.')
-    handle = backend_utils.check_cluster_available(
-        cluster_name,
-        operation=operation,
-    )
-    backend = backend_utils.get_backend_from_handle(handle)
-
-    # Check cloud supports stopping spot instances
-    cloud = handle.launched_resources.cloud
-    assert cloud is not None, handle
+    handle, backend = _check_cluster_available_and_get_backend(
+        cluster_name, operation)
 
     if not isinstance(backend, backends.CloudVmRayBackend):
         raise exceptions.NotSupportedError(
@@ -458,6 +476,7 @@ def autostop(
             f'{backend.__class__.__name__!r} is not supported.')
     # Check autostop is implemented for cloud
     cloud = handle.launched_resources.cloud
+    assert cloud is not None, handle
     if not down and not is_cancel:
         try:
             cloud.check_features_are_supported(
@@ -482,12 +501,19 @@ def autostop(
 @usage_lib.entrypoint
 def queue(cluster_name: str,
           skip_finished: bool = False,
-          all_users: bool = False) -> List[dict]:
+          all_users: bool = False,
+          wait_for_change: Optional[float] = None) -> List[dict]:
     # NOTE(dev): Keep the docstring consistent between the Python API and CLI.
     """Get the job queue of a cluster.
 
     Please refer to the sky.cli.queue for the document.
 
+    Additional arguments:
+        wait_for_change: (float) if set, the head node waits up to this many
+            seconds for the job queue to change before returning it. Useful to
+            watch the job queue with one round trip to the cluster per change,
+            instead of one per poll.
+
     Returns:
         List[dict]:
         [
@@ -515,16 +541,14 @@ def queue(cluster_name: str,
         exceptions.CommandError: if failed to get the job queue with ssh.
     """
     all_jobs = not skip_finished
-    username: Optional[str] = getpass.getuser()
+    username: Optional[str] = _current_user()
     if all_users:
         username = None
-    code = job_lib.JobLibCodeGen.get_job_queue(username, all_jobs)
+    code = job_lib.JobLibCodeGen.get_job_queue(
+        username, all_jobs, max_wait_seconds=wait_for_change)
 
-    handle = backend_utils.check_cluster_available(
-        cluster_name,
-        operation='getting the job queue',
-    )
-    backend = backend_utils.get_backend_from_handle(handle)
+    handle, backend = _check_cluster_available_and_get_backend(
+        cluster_name, 'getting the job queue')
 
     returncode, jobs_payload, stderr = backend.run_on_head(handle,
                                                            code,
@@ -572,13 +596,13 @@ def cancel(
         sky.exceptions.CloudUserIdentityError: if we fail to get the current
           user identity.
     """
-    controller_utils.check_cluster_name_not_controller(
-        cluster_name, operation_str='Cancelling jobs')
-
     if all and job_ids:
         raise ValueError('Cannot specify both `all` and `job_ids`. To cancel '
                          'all jobs, set `job_ids` to None.')
 
+    controller_utils.check_cluster_name_not_controller(
+        cluster_name, operation_str='Cancelling jobs')
+
     # Check the status of the cluster.
     handle = None
     try:
@@ -649,11 +673,8 @@ def tail_logs(cluster_name: str,
           user identity.
     """
     # Check the status of the cluster.
-    handle = backend_utils.check_cluster_available(
-        cluster_name,
-        operation='tailing logs',
-    )
-    backend = backend_utils.get_backend_from_handle(handle)
+    handle, backend = _check_cluster_available_and_get_backend(
+        cluster_name, 'tailing logs')
 
     job_str = f'job {job_id}'
     if job_id is None:
@@ -691,11 +712,8 @@ def download_logs(
           user identity.
     """
     # Check the status of the cluster.
-    handle = backend_utils.check_cluster_available(
-        cluster_name,
-        operation='downloading logs',
-    )
-    backend = backend_utils.get_backend_from_handle(handle)
+    handle, backend = _check_cluster_available_and_get_backend(
+        cluster_name, 'downloading logs')
     assert isinstance(backend, backends.CloudVmRayBackend), backend
 
     if job_ids is not None and len(job_ids) == 0:
@@ -736,11 +754,8 @@ def job_status(cluster_name: str,
           user identity.
     """
     # Check the status of the cluster.
-    handle = backend_utils.check_cluster_available(
-        cluster_name,
-        operation='getting job status',
-    )
-    backend = backend_utils.get_backend_from_handle(handle)
+    handle, backend = _check_cluster_available_and_get_backend(
+        cluster_name, 'getting job status')
     if not isinstance(backend, backends.CloudVmRayBackend):
         raise exceptions.NotSupportedError(
             f'Getting job status is not supported for cluster {cluster_name!r} '
@@ -778,10 +793,7 @@ def storage_ls() -> List[Dict[str, Any]]:
             }
         ]
     """
-    storages = global_user_state.get_storage()
-    for storage in storages:
-        storage['store'] = list(storage.pop('handle').sky_stores.keys())
-    return storages
+    return global_user_state.list_storage_summaries()
 
 
 @usage_lib.entrypoint
@@ -9,7 +9,6 @@ import colorama
 from sky import exceptions
 from sky import sky_logging
 from sky.utils import log_utils
-from sky.utils.cli_utils import status_utils
 
 logger = sky_logging.init_logger(__name__)
 
@@ -30,6 +29,10 @@ def format_storage_table(storages: List[Dict[str, Any]],
     Returns:
         str: The formatted storage table.
     """
+    # Imported here, as status_utils imports sky.backends, which in turn
+    # imports this module through sky.task.
+    # pylint: disable=import-outside-toplevel
+    from sky.utils.cli_utils import status_utils
     storage_table = log_utils.create_table([
         'NAME',
         'UPDATED',
@@ -130,6 +130,12 @@ def create_table(cursor, conn):
         # clusters were never really UP, setting it to 1 means they won't be
         # auto-deleted during any failover.
         value_to_replace_existing_entries=1)
+    # JSON list of the store types in the storage handle, so that listing the
+    # storages does not need to unpickle the handles. It is null for the
+    # storages added before this column, and is backfilled by
+    # list_storage_summaries().
+    db_utils.add_column_to_table(cursor, conn, 'storage', 'store_types',
+                                 'TEXT DEFAULT null')
     conn.commit()
 
 
@@ -707,11 +713,17 @@ def set_enabled_clouds(enabled_clouds: List[str]) -> None:
     _DB.conn.commit()
 
 
+def _get_store_types_json(storage_handle: 'Storage.StorageMetadata') -> str:
+    return json.dumps(
+        [store_type.value for store_type in storage_handle.sky_stores])
+
+
 def add_or_update_storage(storage_name: str,
                           storage_handle: 'Storage.StorageMetadata',
                           storage_status: status_lib.StorageStatus):
     storage_launched_at = int(time.time())
     handle = pickle.dumps(storage_handle)
+    store_types = _get_store_types_json(storage_handle)
     last_use = common_utils.get_pretty_entry_point()
 
     def status_check(status):
@@ -720,9 +732,12 @@ def add_or_update_storage(storage_name: str,
     if not status_check(storage_status):
         raise ValueError(f'Error in updating global state. Storage Status '
                          f'{storage_status} is passed in incorrectly')
-    _DB.cursor.execute('INSERT OR REPLACE INTO storage VALUES (?, ?, ?, ?, ?)',
-                       (storage_name, storage_launched_at, handle, last_use,
-                        storage_status.value))
+    _DB.cursor.execute(
+        'INSERT OR REPLACE INTO storage '
+        '(name, launched_at, handle, last_use, status, store_types) '
+        'VALUES (?, ?, ?, ?, ?, ?)', (storage_name, storage_launched_at, handle,
+                                      last_use, storage_status.value,
+                                      store_types))
     _DB.conn.commit()
 
 
@@ -756,10 +771,12 @@ def get_storage_status(storage_name: str) -> Optional[status_lib.StorageStatus]:
 
 def set_storage_handle(storage_name: str,
                        handle: 'Storage.StorageMetadata') -> None:
-    _DB.cursor.execute('UPDATE storage SET handle=(?) WHERE name=(?)', (
-        pickle.dumps(handle),
-        storage_name,
-    ))
+    _DB.cursor.execute(
+        'UPDATE storage SET handle=(?), store_types=(?) WHERE name=(?)', (
+            pickle.dumps(handle),
+            _get_store_types_json(handle),
+            storage_name,
+        ))
     count = _DB.cursor.rowcount
     _DB.conn.commit()
     assert count <= 1, count
@@ -794,7 +811,8 @@ def get_storage_names_start_with(starts_with: str) -> List[str]:
 
 
 def get_storage() -> List[Dict[str, Any]]:
-    rows = _DB.cursor.execute('select * from storage')
+    rows = _DB.cursor.execute(
+        'select name, launched_at, handle, last_use, status from storage')
     records = []
     for name, launched_at, handle, last_use, status in rows:
         # TODO: use namedtuple instead of dict
@@ -806,3 +824,40 @@ def get_storage() -> List[Dict[str, Any]]:
             'status': status_lib.StorageStatus[status],
         })
     return records
+
+
+def list_storage_summaries() -> List[Dict[str, Any]]:
+    """Returns the storages, with the store types instead of the handles.
+
+    The store types are read from the store_types column, so that the handles
+    are only unpickled for the storages added before the column existed, whose
+    store types are then backfilled.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sky.data import storage as storage_lib
+    rows = _DB.cursor.execute(
+        'select name, launched_at, last_use, status, store_types from storage')
+    records = []
+    backfills = []
+    for name, launched_at, last_use, status, store_types in rows.fetchall():
+        if store_types is None:
+            handle_rows = _DB.cursor.execute(
+                'SELECT handle FROM storage WHERE name=(?)', (name,))
+            handle = pickle.loads(handle_rows.fetchone()[0])
+            store_types = _get_store_types_json(handle)
+            backfills.append((store_types, name))
+        records.append({
+            'name': name,
+            'launched_at': launched_at,
+            'store': [
+                storage_lib.StoreType(store_type)
+                for store_type in json.loads(store_types)
+            ],
+            'last_use': last_use,
+            'status': status_lib.StorageStatus[status],
+        })
+    if backfills:
+        _DB.cursor.executemany(
+            'UPDATE storage SET store_types=(?) WHERE name=(?)', backfills)
+        _DB.conn.commit()
+    return records
@@ -611,6 +611,14 @@ class KubernetesInstanceType:
         - 4CPU--16GB--1V100
     """
 
+    # Compiled once, as the instance type names are validated and parsed for
+    # every candidate resources in the optimizer.
+    _VALID_NAME_PATTERN = re.compile(
+        r'^(\d+(\.\d+)?CPU--\d+(\.\d+)?GB)(--\d+\S+)?$')
+    _PARSE_NAME_PATTERN = re.compile(
+        r'^(?P<cpus>\d+(\.\d+)?)CPU--(?P<memory>\d+(\.\d+)?)GB(?:--(?P<accelerator_count>\d+)(?P<accelerator_type>\S+))?$'  # pylint: disable=line-too-long
+    )
+
     def __init__(self,
                  cpus: float,
                  memory: float,
@@ -632,11 +640,10 @@ class KubernetesInstanceType:
             name += f'--{self.accelerator_count}{self.accelerator_type}'
         return name
 
-    @staticmethod
-    def is_valid_instance_type(name: str) -> bool:
+    @classmethod
+    def is_valid_instance_type(cls, name: str) -> bool:
         """Returns whether the given name is a valid instance type."""
-        pattern = re.compile(r'^(\d+(\.\d+)?CPU--\d+(\.\d+)?GB)(--\d+\S+)?$')
-        return bool(pattern.match(name))
+        return bool(cls._VALID_NAME_PATTERN.match(name))
 
     @classmethod
     def _parse_instance_type(
@@ -650,10 +657,7 @@ class KubernetesInstanceType:
             accelerator_count | float: Number of accelerators
             accelerator_type | str: Type of accelerator
         """
-        pattern = re.compile(
-            r'^(?P<cpus>\d+(\.\d+)?)CPU--(?P<memory>\d+(\.\d+)?)GB(?:--(?P<accelerator_count>\d+)(?P<accelerator_type>\S+))?$'  # pylint: disable=line-too-long
-        )
-        match = pattern.match(name)
+        match = cls._PARSE_NAME_PATTERN.match(name)
         if match:
             cpus = float(match.group('cpus'))
             memory = float(match.group('memory'))
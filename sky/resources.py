@@ -10,7 +10,6 @@ from sky import clouds
 from sky import exceptions
 from sky import sky_logging
 from sky import skypilot_config
-from sky import spot
 from sky.clouds import service_catalog
 from sky.provision import docker_utils
 from sky.skylet import constants
@@ -764,6 +763,10 @@ class Resources:
                 raise ValueError(
                     'Cannot specify spot_recovery without use_spot set to True.'
                 )
+        # Imported here, as sky.spot imports sky.backends, which in turn
+        # imports this module.
+        # pylint: disable=import-outside-toplevel
+        from sky import spot
         if self._spot_recovery not in spot.SPOT_STRATEGIES:
             with ux_utils.print_exception_no_traceback():
                 raise ValueError(
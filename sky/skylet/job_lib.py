@@ -681,12 +681,16 @@ def format_job_queue(jobs: List[Dict[str, Any]]):
     return job_table
 
 
-def dump_job_queue(username: Optional[str], all_jobs: bool) -> str:
+def dump_job_queue(username: Optional[str],
+                   all_jobs: bool,
+                   max_wait_seconds: float = 0) -> str:
     """Get the job queue in encoded json format.
 
     Args:
         username: The username to show jobs for. Show all the users if None.
         all_jobs: Whether to show all jobs, not just the pending/running ones.
+        max_wait_seconds: If positive, wait up to this many seconds for the
+            job queue to change before returning it.
     """
     status_list: Optional[List[JobStatus]] = [
         JobStatus.SETTING_UP, JobStatus.PENDING, JobStatus.RUNNING
@@ -694,7 +698,12 @@ def dump_job_queue(username: Optional[str], all_jobs: bool) -> str:
     if all_jobs:
         status_list = None
 
-    jobs = _get_jobs(username, status_list=status_list)
+    if max_wait_seconds > 0:
+        jobs = common_utils.poll_until_changed(
+            lambda: _get_jobs(username, status_list=status_list),
+            max_wait_seconds)
+    else:
+        jobs = _get_jobs(username, status_list=status_list)
     for job in jobs:
         job['status'] = job['status'].value
         job['log_path'] = os.path.join(constants.SKY_LOGS_DIRECTORY,
@@ -851,10 +860,25 @@ class JobLibCodeGen:
         return cls._build(code)
 
     @classmethod
-    def get_job_queue(cls, username: Optional[str], all_jobs: bool) -> str:
-        code = [
+    def get_job_queue(cls,
+                      username: Optional[str],
+                      all_jobs: bool,
+                      max_wait_seconds: Optional[float] = None) -> str:
+        """See job_lib.dump_job_queue()."""
+        code: List[str] = []
+        wait_kwargs_str = ''
+        if max_wait_seconds is not None:
+            # Remote clusters with an older job_lib return the job queue
+            # immediately.
+            code.append('wait_kwargs = '
+                        f'{{"max_wait_seconds": {max_wait_seconds!r}}} '
+                        'if getattr(constants, "SKYLET_LIB_VERSION", 0) >= 2 '
+                        'else {}')
+            wait_kwargs_str = ', **wait_kwargs'
+        code += [
             'job_queue = job_lib.dump_job_queue('
-            f'{username!r}, {all_jobs})', 'print(job_queue, flush=True)'
+            f'{username!r}, {all_jobs}{wait_kwargs_str})',
+            'print(job_queue, flush=True)'
         ]
         return cls._build(code)
 
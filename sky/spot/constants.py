@@ -5,6 +5,10 @@ SPOT_CONTROLLER_YAML_PREFIX = '~/.sky/spot_controller'
 
 SPOT_TASK_YAML_PREFIX = '~/.sky/spot_tasks'
 
+# Lock for restarting the spot controller from `sky spot queue --refresh`, so
+# that concurrent refreshes start the controller only once.
+SPOT_CONTROLLER_START_LOCK_PATH = '~/.sky/.spot_controller_start.lock'
+
 # Resources as a dict for the spot controller.
 # Use default CPU instance type for spot controller with >= 24GB, i.e.
 # m6i.2xlarge (8vCPUs, 32 GB) for AWS, Standard_D8s_v4 (8vCPUs, 32 GB)
@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Union
 import uuid
 
 import colorama
+import filelock
 
 import sky
 from sky import backends
@@ -132,12 +133,18 @@ def launch(
 
 
 @usage_lib.entrypoint
-def queue(refresh: bool, skip_finished: bool = False) -> List[Dict[str, Any]]:
+def queue(refresh: bool,
+          skip_finished: bool = False,
+          wait_for_change: Optional[float] = None) -> List[Dict[str, Any]]:
     # NOTE(dev): Keep the docstring consistent between the Python API and CLI.
     """Get statuses of managed spot jobs.
 
     Please refer to the sky.cli.spot_queue for the documentation.
 
+    Additional arguments:
+        wait_for_change: (float) if set, the spot controller waits up to this
+            many seconds for the spot job table to change before returning it.
+
     Returns:
         [
             {
@@ -178,7 +185,17 @@ def queue(refresh: bool, skip_finished: bool = False) -> List[Dict[str, Any]]:
 
         rich_utils.force_update_status('[cyan] Checking spot jobs - restarting '
                                        'controller[/]')
-        handle = sky.start(spot_utils.SPOT_CONTROLLER_NAME)
+        with filelock.FileLock(
+                os.path.expanduser(constants.SPOT_CONTROLLER_START_LOCK_PATH)):
+            # Another process may have started the controller while we were
+            # waiting for the lock, in which case there is no need to start
+            # it again.
+            controller_status, handle = (
+                backend_utils.refresh_cluster_status_handle(
+                    spot_utils.SPOT_CONTROLLER_NAME))
+            if (controller_status != status_lib.ClusterStatus.UP or
+                    handle is None):
+                handle = sky.start(spot_utils.SPOT_CONTROLLER_NAME)
         controller_status = status_lib.ClusterStatus.UP
         rich_utils.force_update_status('[cyan] Checking spot jobs[/]')
 
@@ -187,7 +204,8 @@ def queue(refresh: bool, skip_finished: bool = False) -> List[Dict[str, Any]]:
     backend = backend_utils.get_backend_from_handle(handle)
     assert isinstance(backend, backends.CloudVmRayBackend)
 
-    code = spot_utils.SpotCodeGen.get_job_table()
+    code = spot_utils.SpotCodeGen.get_job_table(
+        max_wait_seconds=wait_for_change)
     returncode, job_table_payload, stderr = backend.run_on_head(
         handle,
         code,
@@ -227,14 +245,13 @@ def cancel(name: Optional[str] = None,
     Please refer to the sky.cli.spot_cancel for the document.
 
     Raises:
+        ValueError: invalid arguments.
         sky.exceptions.ClusterNotUpError: the spot controller is not up.
         RuntimeError: failed to cancel the job.
     """
     job_ids = [] if job_ids is None else job_ids
-    handle = backend_utils.is_controller_accessible(
-        controller_type=controller_utils.Controllers.SPOT_CONTROLLER,
-        stopped_message='All managed spot jobs should have finished.')
-
+    # Validate the arguments before checking the controller, which may query
+    # the cloud for the controller's status.
     job_id_str = ','.join(map(str, job_ids))
     if sum([len(job_ids) > 0, name is not None, all]) != 1:
         argument_str = f'job_ids={job_id_str}' if len(job_ids) > 0 else ''
@@ -244,6 +261,10 @@ def cancel(name: Optional[str] = None,
             raise ValueError('Can only specify one of JOB_IDS or name or all. '
                              f'Provided {argument_str!r}.')
 
+    handle = backend_utils.is_controller_accessible(
+        controller_type=controller_utils.Controllers.SPOT_CONTROLLER,
+        stopped_message='All managed spot jobs should have finished.')
+
     backend = backend_utils.get_backend_from_handle(handle)
     assert isinstance(backend, backends.CloudVmRayBackend)
     if all:
@@ -444,8 +444,18 @@ def stream_logs_by_name(job_name: str, follow: bool = True) -> str:
     return ''
 
 
-def dump_spot_job_queue() -> str:
-    jobs = spot_state.get_spot_jobs()
+def dump_spot_job_queue(max_wait_seconds: float = 0) -> str:
+    """Get the spot job queue in encoded json format.
+
+    Args:
+        max_wait_seconds: If positive, wait up to this many seconds for the
+            spot job table to change before returning it.
+    """
+    if max_wait_seconds > 0:
+        jobs = common_utils.poll_until_changed(spot_state.get_spot_jobs,
+                                               max_wait_seconds)
+    else:
+        jobs = spot_state.get_spot_jobs()
 
     for job in jobs:
         end_at = job['end_at']
@@ -676,9 +686,23 @@ class SpotCodeGen:
     ]
 
     @classmethod
-    def get_job_table(cls) -> str:
-        code = [
-            'job_table = spot_utils.dump_spot_job_queue()',
+    def get_job_table(cls, max_wait_seconds: Optional[float] = None) -> str:
+        """See spot_utils.dump_spot_job_queue()."""
+        code: List[str] = []
+        wait_kwargs_str = ''
+        if max_wait_seconds is not None:
+            # Controllers with an older spot_utils return the job table
+            # immediately.
+            code += [
+                'from sky.skylet import constants',
+                'wait_kwargs = '
+                f'{{"max_wait_seconds": {max_wait_seconds!r}}} '
+                'if getattr(constants, "SKYLET_LIB_VERSION", 0) >= 2 '
+                'else {}',
+            ]
+            wait_kwargs_str = '**wait_kwargs'
+        code += [
+            f'job_table = spot_utils.dump_spot_job_queue({wait_kwargs_str})',
             'print(job_table, flush=True)',
         ]
         return cls._build(code)
@@ -18,7 +18,6 @@ import sky.dag
 from sky.data import data_utils
 from sky.data import storage as storage_lib
 from sky.provision import docker_utils
-from sky.serve import service_spec
 from sky.skylet import constants
 from sky.utils import common_utils
 from sky.utils import schemas
@@ -26,6 +25,7 @@ from sky.utils import ux_utils
 
 if typing.TYPE_CHECKING:
     from sky import resources as resources_lib
+    from sky.serve import service_spec
 
 logger = sky_logging.init_logger(__name__)
 
@@ -263,7 +263,7 @@ class Task:
         # Default to CPU VM
         self.resources: Union[List[sky.Resources],
                               Set[sky.Resources]] = {sky.Resources()}
-        self._service: Optional[service_spec.SkyServiceSpec] = None
+        self._service: Optional['service_spec.SkyServiceSpec'] = None
         # Resources that this task cannot run on.
         self.blocked_resources = blocked_resources
 
@@ -449,6 +449,10 @@ class Task:
 
         service = config.pop('service', None)
         if service is not None:
+            # Imported here, as sky.serve imports sky.backends, which in turn
+            # imports this module.
+            # pylint: disable=import-outside-toplevel
+            from sky.serve import service_spec
             service = service_spec.SkyServiceSpec.from_yaml_config(service)
         task.set_service(service)
 
@@ -629,11 +633,11 @@ class Task:
         return self
 
     @property
-    def service(self) -> Optional[service_spec.SkyServiceSpec]:
+    def service(self) -> Optional['service_spec.SkyServiceSpec']:
         return self._service
 
     def set_service(self,
-                    service: Optional[service_spec.SkyServiceSpec]) -> 'Task':
+                    service: Optional['service_spec.SkyServiceSpec']) -> 'Task':
         """Sets the service spec for this task.
 
         Args:
@@ -27,6 +27,13 @@ from sky.skylet import constants
 from sky.utils import ux_utils
 from sky.utils import validator
 
+# orjson is optional. It decodes large payloads, e.g., the job queue of a
+# long-running cluster, several times faster than json.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 _USER_HASH_FILE = os.path.expanduser('~/.sky/user_hash')
 USER_HASH_LENGTH = 8
 USER_HASH_LENGTH_IN_CLUSTER_NAME = 4
@@ -242,6 +249,38 @@ class Backoff:
         return self._backoff
 
 
+def poll_until_changed(fetch: Callable[[], Any],
+                       max_wait_seconds: float,
+                       initial_interval: float = 0.25,
+                       max_interval: float = 2) -> Any:
+    """Calls fetch() until its result changes, and returns the latest result.
+
+    This is used to long-poll a table on the remote cluster, so that a single
+    round trip to the cluster covers a period of idleness. The polling interval
+    doubles from `initial_interval` up to `max_interval`.
+
+    Args:
+        fetch: A function without arguments whose results can be compared with
+          `==`.
+        max_wait_seconds: Return the latest result after this many seconds,
+          even if it has not changed.
+        initial_interval: The first interval between two fetch() calls.
+        max_interval: The maximum interval between two fetch() calls.
+    """
+    start = time.time()
+    initial_result = fetch()
+    interval = initial_interval
+    while True:
+        remaining = max_wait_seconds - (time.time() - start)
+        if remaining <= 0:
+            return initial_result
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, max_interval)
+        result = fetch()
+        if result != initial_result:
+            return result
+
+
 def get_pretty_entry_point() -> str:
     """Returns the prettified entry point of this process (sys.argv).
 
@@ -431,6 +470,13 @@ def decode_payload(payload_str: str) -> Any:
     if not matched:
         raise ValueError(f'Invalid payload string: \n{payload_str}')
     payload_str = matched[0]
+    if orjson is not None:
+        try:
+            return orjson.loads(payload_str)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json, e.g., it rejects the NaN that
+            # json.dumps() may encode.
+            pass
     payload = json.loads(payload_str)
     return payload
 
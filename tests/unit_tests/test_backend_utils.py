@@ -0,0 +1,242 @@
+import subprocess
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from sky import backends
+from sky import status_lib
+from sky.backends import backend_utils
+
+
+def _run_batched(cmds):
+    proc = subprocess.run(
+        ['bash', '-c', backend_utils.make_batched_command(cmds)],
+        capture_output=True,
+        text=True,
+        check=True)
+    return proc.stdout
+
+
+class TestBatchedCommand:
+
+    def test_outputs_of_each_command(self):
+        cmds = [
+            'echo out1; echo err1 >&2',
+            'echo out2; exit 3',
+            'echo err3 >&2; exit 1',
+        ]
+        stdout = _run_batched(cmds)
+        assert backend_utils.parse_batched_outputs(stdout, len(cmds)) == [
+            (0, 'out1\n', 'err1\n'),
+            (3, 'out2\n', ''),
+            (1, '', 'err3\n'),
+        ]
+
+    def test_json_payload(self):
+        # json.dumps() escapes the separator, so it cannot break the framing.
+        cmds = [
+            'python3 -c \'import json; print(json.dumps({"a": chr(30)}))\''
+        ]
+        stdout = _run_batched(cmds)
+        assert backend_utils.parse_batched_outputs(stdout, 1) == [
+            (0, '{"a": "\\u001e"}\n', '')
+        ]
+
+    def test_truncated_output(self):
+        stdout = _run_batched(['echo 1', 'echo 2'])
+        with pytest.raises(ValueError):
+            backend_utils.parse_batched_outputs(stdout[:-1], 2)
+
+    def test_wrong_number_of_commands(self):
+        stdout = _run_batched(['echo 1', 'echo 2'])
+        with pytest.raises(ValueError):
+            backend_utils.parse_batched_outputs(stdout, 3)
+
+    def test_malformed_output(self):
+        with pytest.raises(ValueError):
+            backend_utils.parse_batched_outputs('ssh: connection refused', 1)
+        with pytest.raises(ValueError):
+            backend_utils.parse_batched_outputs('out\x1enot-an-int\x1e\x1e', 1)
+
+
+class TestClusterStatusCache:
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, monkeypatch):
+        backend_utils.clear_cluster_status_cache()
+        monkeypatch.setattr(backend_utils, '_CLUSTER_STATUS_CACHE_TTL_SECONDS',
+                            5)
+        self.now = 100.0
+        monkeypatch.setattr(backend_utils, '_monotonic', lambda: self.now)
+        self.db = {
+            'c': {
+                'status': status_lib.ClusterStatus.UP,
+                'launched_at': 1,
+                'handle': 'handle',
+            }
+        }
+        monkeypatch.setattr(backend_utils.global_user_state,
+                            'get_cluster_from_name', self.db.get)
+        with patch.object(backend_utils,
+                          'refresh_cluster_record',
+                          side_effect=lambda name, **kwargs: self.db.get(name)
+                         ) as mock_refresh:
+            self.mock_refresh = mock_refresh
+            yield
+        backend_utils.clear_cluster_status_cache()
+
+    def _refresh(self, **kwargs):
+        return backend_utils.refresh_cluster_status_handle('c', **kwargs)
+
+    def test_hit_within_ttl(self):
+        assert self._refresh() == (status_lib.ClusterStatus.UP, 'handle')
+        self.now += 4
+        assert self._refresh() == (status_lib.ClusterStatus.UP, 'handle')
+        assert self.mock_refresh.call_count == 1
+
+    def test_miss_after_ttl(self):
+        self._refresh()
+        self.now += 5
+        self._refresh()
+        assert self.mock_refresh.call_count == 2
+
+    def test_miss_when_status_changed(self):
+        self._refresh()
+        self.db['c'] = dict(self.db['c'],
+                            status=status_lib.ClusterStatus.STOPPED)
+        assert self._refresh() == (status_lib.ClusterStatus.STOPPED, 'handle')
+        assert self.mock_refresh.call_count == 2
+
+    def test_miss_when_launched_at_changed(self):
+        self._refresh()
+        self.db['c'] = dict(self.db['c'], launched_at=2, handle='new_handle')
+        assert self._refresh() == (status_lib.ClusterStatus.UP, 'new_handle')
+        assert self.mock_refresh.call_count == 2
+
+    def test_force_refresh_bypasses_and_updates_cache(self):
+        force_refresh_statuses = set(status_lib.ClusterStatus)
+        self._refresh()
+        self._refresh(force_refresh_statuses=force_refresh_statuses)
+        assert self.mock_refresh.call_count == 2
+        self.now += 10
+        self._refresh(force_refresh_statuses=force_refresh_statuses)
+        assert self.mock_refresh.call_count == 3
+        # The forced refresh is reused by the following calls.
+        self._refresh()
+        assert self.mock_refresh.call_count == 3
+
+    def test_deleted_cluster(self):
+        del self.db['c']
+        assert self._refresh() == (None, None)
+        assert self._refresh() == (None, None)
+        assert self.mock_refresh.call_count == 1
+
+    def test_deleted_cluster_recreated(self):
+        cluster = self.db.pop('c')
+        self._refresh()
+        self.db['c'] = cluster
+        assert self._refresh() == (status_lib.ClusterStatus.UP, 'handle')
+        assert self.mock_refresh.call_count == 2
+
+    def test_clear_cache(self):
+        self._refresh()
+        backend_utils.clear_cluster_status_cache('other')
+        self._refresh()
+        assert self.mock_refresh.call_count == 1
+        backend_utils.clear_cluster_status_cache('c')
+        self._refresh()
+        assert self.mock_refresh.call_count == 2
+        backend_utils.clear_cluster_status_cache()
+        self._refresh()
+        assert self.mock_refresh.call_count == 3
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(backend_utils, '_CLUSTER_STATUS_CACHE_TTL_SECONDS',
+                            0)
+        self._refresh()
+        self._refresh()
+        assert self.mock_refresh.call_count == 2
+
+
+class TestClusterStatusCacheWithRefreshClusterRecord:
+    """Runs the real refresh_cluster_record(), with the cloud query mocked."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, monkeypatch):
+        backend_utils.clear_cluster_status_cache()
+        monkeypatch.setattr(backend_utils, '_CLUSTER_STATUS_CACHE_TTL_SECONDS',
+                            5)
+        self.now = 100.0
+        monkeypatch.setattr(backend_utils, '_monotonic', lambda: self.now)
+        handle = Mock(spec=backends.CloudVmRayResourceHandle)
+        handle.launched_resources = Mock(use_spot=False)
+        self.db = {
+            'c': {
+                'status': status_lib.ClusterStatus.UP,
+                'launched_at': 1,
+                'handle': handle,
+                'autostop': 10,
+            }
+        }
+        monkeypatch.setattr(backend_utils.global_user_state,
+                            'get_cluster_from_name', self.db.get)
+        monkeypatch.setattr(backend_utils, 'check_owner_identity',
+                            lambda cluster_name: None)
+        # The cloud reports the cluster as stopped by autostop.
+        self.db_after_refresh = dict(self.db['c'],
+                                     status=status_lib.ClusterStatus.STOPPED)
+
+        def update_cluster_status(cluster_name, **kwargs):
+            del kwargs
+            self.db[cluster_name] = self.db_after_refresh
+            return self.db_after_refresh
+
+        with patch.object(
+                backend_utils,
+                '_update_cluster_status',
+                side_effect=update_cluster_status) as mock_update_status:
+            self.mock_update_status = mock_update_status
+            yield
+        backend_utils.clear_cluster_status_cache()
+
+    def _refresh(self, **kwargs):
+        status, _ = backend_utils.refresh_cluster_status_handle('c', **kwargs)
+        return status
+
+    def test_reuses_refreshed_status(self):
+        assert self._refresh() == status_lib.ClusterStatus.STOPPED
+        assert self._refresh() == status_lib.ClusterStatus.STOPPED
+        assert self.mock_update_status.call_count == 1
+        self.now += 5
+        # Stopped clusters are not refreshed without force_refresh_statuses.
+        assert self._refresh() == status_lib.ClusterStatus.STOPPED
+        assert self.mock_update_status.call_count == 1
+
+    def test_force_refresh_statuses(self):
+        self._refresh()
+        self._refresh(force_refresh_statuses={status_lib.ClusterStatus.STOPPED})
+        assert self.mock_update_status.call_count == 2
+        # Not forced for the status of the cluster.
+        self._refresh(force_refresh_statuses={status_lib.ClusterStatus.INIT})
+        assert self.mock_update_status.call_count == 2
+
+    def test_terminated_by_cloud(self):
+        self.db_after_refresh = None
+        assert self._refresh() is None
+        assert self._refresh() is None
+        assert self.mock_update_status.call_count == 1
+
+
+@pytest.mark.parametrize('value,expected', [
+    (None, 5),
+    ('0', 0),
+    ('1.5', 1.5),
+    ('not-a-number', 5),
+])
+def test_get_cluster_status_cache_ttl_seconds(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv('SKYPILOT_STATUS_CACHE_TTL_SECONDS', raising=False)
+    else:
+        monkeypatch.setenv('SKYPILOT_STATUS_CACHE_TTL_SECONDS', value)
+    assert backend_utils._get_cluster_status_cache_ttl_seconds() == expected
@@ -0,0 +1,47 @@
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from sky.backends import cloud_vm_ray_backend
+from sky.skylet import log_lib
+
+
+def _run_locally(handle, cmd, **kwargs):
+    # Run the command on the local machine the same way as run_on_head()
+    # runs it on the head node, to check the arguments used are compatible.
+    del handle
+    process_stream = kwargs.pop('process_stream', True)
+    return log_lib.run_with_log(['bash', '-c', cmd],
+                                '/dev/null',
+                                require_outputs=kwargs.pop('require_outputs'),
+                                stream_logs=kwargs.pop('stream_logs'),
+                                process_stream=process_stream)
+
+
+class TestRunOnHeadBatch:
+
+    def test_runs_commands_in_one_call(self):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        with patch.object(backend, 'run_on_head',
+                          side_effect=_run_locally) as mock_run_on_head:
+            results = backend.run_on_head_batch(
+                Mock(), ['echo a', 'echo b >&2; exit 2'])
+        assert mock_run_on_head.call_count == 1
+        _, kwargs = mock_run_on_head.call_args
+        assert kwargs['require_outputs']
+        assert kwargs['separate_stderr']
+        assert kwargs.get('process_stream', True)
+        assert results == [(0, 'a\n', ''), (2, '', 'b\n')]
+
+    def test_no_commands(self):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        with patch.object(backend, 'run_on_head') as mock_run_on_head:
+            assert backend.run_on_head_batch(Mock(), []) == []
+        mock_run_on_head.assert_not_called()
+
+    def test_ssh_failure(self):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        with patch.object(backend,
+                          'run_on_head',
+                          return_value=(255, '', 'Connection refused')):
+            results = backend.run_on_head_batch(Mock(), ['echo a', 'echo b'])
+        assert results == [(255, '', 'Connection refused')] * 2
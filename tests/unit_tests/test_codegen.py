@@ -0,0 +1,74 @@
+import shlex
+from unittest.mock import patch
+
+import pytest
+
+from sky.skylet import constants
+from sky.skylet import job_lib
+from sky.spot import spot_utils
+
+
+def _exec_generated_code(cmd: str) -> None:
+    # The commands are `<python> -u -c <code>`; run the code in this process,
+    # so that the functions it calls can be mocked.
+    code = shlex.split(cmd)[-1]
+    exec(code, {})  # pylint: disable=exec-used
+
+
+class TestJobLibCodeGen:
+
+    @pytest.mark.parametrize('max_wait_seconds,expected_kwargs', [
+        (None, {}),
+        (0, {
+            'max_wait_seconds': 0
+        }),
+        (30.5, {
+            'max_wait_seconds': 30.5
+        }),
+    ])
+    def test_get_job_queue(self, max_wait_seconds, expected_kwargs):
+        cmd = job_lib.JobLibCodeGen.get_job_queue('user\'s "name"',
+                                                  True,
+                                                  max_wait_seconds)
+        with patch.object(job_lib, 'dump_job_queue',
+                          return_value='') as mock_dump:
+            _exec_generated_code(cmd)
+        mock_dump.assert_called_once_with('user\'s "name"', True,
+                                          **expected_kwargs)
+
+    @pytest.mark.parametrize('version', [None, 1])
+    def test_get_job_queue_old_skylet_lib(self, monkeypatch, version):
+        cmd = job_lib.JobLibCodeGen.get_job_queue(None, False, 30)
+        # Versions before 1 have no SKYLET_LIB_VERSION.
+        if version is None:
+            monkeypatch.delattr(constants, 'SKYLET_LIB_VERSION')
+        else:
+            monkeypatch.setattr(constants, 'SKYLET_LIB_VERSION', version)
+        with patch.object(job_lib, 'dump_job_queue',
+                          return_value='') as mock_dump:
+            _exec_generated_code(cmd)
+        mock_dump.assert_called_once_with(None, False)
+
+
+class TestSpotCodeGen:
+
+    @pytest.mark.parametrize('max_wait_seconds,expected_kwargs', [
+        (None, {}),
+        (30.5, {
+            'max_wait_seconds': 30.5
+        }),
+    ])
+    def test_get_job_table(self, max_wait_seconds, expected_kwargs):
+        cmd = spot_utils.SpotCodeGen.get_job_table(max_wait_seconds)
+        with patch.object(spot_utils, 'dump_spot_job_queue',
+                          return_value='') as mock_dump:
+            _exec_generated_code(cmd)
+        mock_dump.assert_called_once_with(**expected_kwargs)
+
+    def test_get_job_table_old_skylet_lib(self, monkeypatch):
+        cmd = spot_utils.SpotCodeGen.get_job_table(30)
+        monkeypatch.setattr(constants, 'SKYLET_LIB_VERSION', 1)
+        with patch.object(spot_utils, 'dump_spot_job_queue',
+                          return_value='') as mock_dump:
+            _exec_generated_code(cmd)
+        mock_dump.assert_called_once_with()
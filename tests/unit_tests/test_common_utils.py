@@ -1,3 +1,4 @@
+import math
 from unittest.mock import patch
 
 import pytest
@@ -49,3 +50,56 @@ class TestMakeClusterNameOnCloud:
         mock_get_user_hash.return_value = MOCKED_USER_HASH
         assert "cuda-11-8-ab12" == common_utils.make_cluster_name_on_cloud(
             "Cuda_11.8")
+
+
+class TestPollUntilChanged:
+
+    @patch('time.sleep')
+    def test_returns_on_change(self, mock_sleep):
+        results = iter([1, 1, 1, 2])
+        assert common_utils.poll_until_changed(lambda: next(results), 60) == 2
+        assert [call.args[0] for call in mock_sleep.call_args_list
+               ] == [0.25, 0.5, 1]
+
+    def test_returns_after_max_wait(self):
+        assert common_utils.poll_until_changed(lambda: 1, 0.3) == 1
+
+    def test_no_wait(self):
+        fetch_count = 0
+
+        def fetch():
+            nonlocal fetch_count
+            fetch_count += 1
+            return 1
+
+        assert common_utils.poll_until_changed(fetch, 0) == 1
+        assert fetch_count == 1
+
+
+class TestPayload:
+
+    PAYLOAD = [{'job_id': 1, 'status': 'RUNNING', 'end_at': None}]
+
+    def test_round_trip(self):
+        payload_str = common_utils.encode_payload(self.PAYLOAD)
+        assert common_utils.decode_payload(payload_str) == self.PAYLOAD
+
+    def test_round_trip_with_nan(self):
+        payload_str = common_utils.encode_payload({'value': float('nan')})
+        assert math.isnan(common_utils.decode_payload(payload_str)['value'])
+
+    def test_round_trip_with_polluted_output(self):
+        payload_str = ('LC_ALL: cannot change locale (en_US.UTF-8)\n' +
+                       common_utils.encode_payload(self.PAYLOAD))
+        assert common_utils.decode_payload(payload_str) == self.PAYLOAD
+
+    @patch('sky.utils.common_utils.orjson', None)
+    def test_round_trip_without_orjson(self):
+        payload_str = common_utils.encode_payload(self.PAYLOAD)
+        assert common_utils.decode_payload(payload_str) == self.PAYLOAD
+        payload_str = common_utils.encode_payload({'value': float('nan')})
+        assert math.isnan(common_utils.decode_payload(payload_str)['value'])
+
+    def test_invalid_payload(self):
+        with pytest.raises(ValueError):
+            common_utils.decode_payload('hello, world')
@@ -0,0 +1,71 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _run_in_fresh_interpreter(code: str) -> subprocess.CompletedProcess:
+    # `sky` is already imported by the test session, so check the lazy
+    # attributes in a new interpreter.
+    return subprocess.run([sys.executable, '-c', code],
+                          capture_output=True,
+                          text=True,
+                          check=False)
+
+
+@pytest.mark.parametrize('attr', [
+    'global_user_state',
+    'exceptions',
+    'utils',
+    'backends',
+])
+def test_submodule_accessible_after_import_sky(attr):
+    proc = _run_in_fresh_interpreter(
+        f'import sky; import types; '
+        f'assert isinstance(sky.{attr}, types.ModuleType)')
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_public_api_accessible_after_import_sky():
+    proc = _run_in_fresh_interpreter(
+        'import sky; assert sky.Task is sky.task.Task; '
+        'assert sky.launch is sky.execution.launch')
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_unknown_attribute_raises():
+    proc = _run_in_fresh_interpreter(
+        'import sky\n'
+        'try:\n'
+        '    sky.not_a_submodule\n'
+        'except AttributeError:\n'
+        '    pass\n'
+        'else:\n'
+        '    raise SystemExit(1)\n')
+    assert proc.returncode == 0, proc.stderr
+
+
+@pytest.mark.parametrize('code', [
+    'from sky.skylet import log_lib',
+    'import sky.skylet.job_lib; import sky.core',
+    'import sky.clouds.aws; import sky.core; import sky; '
+    'sky.backends.CloudVmRayBackend',
+    'import sky.global_user_state; import sky.core',
+    'from sky import clouds; import sky; sky.backends.CloudVmRayBackend',
+])
+def test_import_submodule_first(code):
+    # `from sky import <submodule>` inside the package goes through
+    # sky.__getattr__, which must not enter the `sky.backends` import cycle.
+    proc = _run_in_fresh_interpreter(code)
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_skylet_import_does_not_import_backends():
+    # The codegen run on the head node imports these modules for every
+    # `sky queue`, so they should not pull in the backends and clouds.
+    proc = _run_in_fresh_interpreter(
+        'import sys\n'
+        'from sky.skylet import constants, job_lib, log_lib\n'
+        'assert \'sky.backends\' not in sys.modules\n'
+        'assert len(sys.modules) < 600, len(sys.modules)\n')
+    assert proc.returncode == 0, proc.stderr
@@ -0,0 +1,68 @@
+import pytest
+
+import sky
+from sky import global_user_state
+from sky import status_lib
+from sky.data import storage as storage_lib
+from sky.utils import db_utils
+
+
+@pytest.fixture
+def _tmp_state_db(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.setenv('SKYPILOT_DISABLE_USAGE_COLLECTION', '1')
+    db_path = tmp_path / '.sky' / 'state.db'
+    db_path.parent.mkdir()
+    monkeypatch.setattr(
+        global_user_state, '_DB',
+        db_utils.SQLiteConn(str(db_path), global_user_state.create_table))
+
+
+def _add_storage(name, store_types):
+    handle = storage_lib.Storage.StorageMetadata(
+        storage_name=name,
+        source=None,
+        mode=storage_lib.StorageMode.MOUNT,
+        sky_stores={store_type: None for store_type in store_types})
+    global_user_state.add_or_update_storage(name, handle,
+                                            status_lib.StorageStatus.READY)
+
+
+def _get_store_types_column():
+    rows = global_user_state._DB.cursor.execute(
+        'SELECT name, store_types FROM storage')
+    return dict(rows.fetchall())
+
+
+def test_storage_ls_backfills_store_types(_tmp_state_db):
+    _add_storage('s3-storage', [storage_lib.StoreType.S3])
+    _add_storage('multi-storage',
+                 [storage_lib.StoreType.GCS, storage_lib.StoreType.R2])
+    # Storages added before the store_types column existed have it as null.
+    global_user_state._DB.cursor.execute(
+        'UPDATE storage SET store_types=null WHERE name=(?)', ('s3-storage',))
+    global_user_state._DB.conn.commit()
+
+    # The records storage_ls() used to build from the unpickled handles.
+    expected = global_user_state.get_storage()
+    for record in expected:
+        record['store'] = list(record.pop('handle').sky_stores.keys())
+
+    assert sky.storage_ls() == expected
+    assert _get_store_types_column() == {
+        's3-storage': '["S3"]',
+        'multi-storage': '["GCS", "R2"]',
+    }
+    # The backfilled column gives the same records.
+    assert sky.storage_ls() == expected
+
+
+def test_set_storage_handle_updates_store_types(_tmp_state_db):
+    _add_storage('storage', [storage_lib.StoreType.S3])
+    handle = global_user_state.get_handle_from_storage_name('storage')
+    handle.sky_stores[storage_lib.StoreType.GCS] = None
+    global_user_state.set_storage_handle('storage', handle)
+    assert _get_store_types_column() == {'storage': '["S3", "GCS"]'}
+    assert sky.storage_ls()[0]['store'] == [
+        storage_lib.StoreType.S3, storage_lib.StoreType.GCS
+    ]